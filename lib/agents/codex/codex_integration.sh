@@ -14,7 +14,10 @@ mkdir -p "$(dirname "$CODEX_LOG")"
 
 # Logging function
 log_codex() {
-    echo "[$(date +'%Y-%m-%d %H:%M:%S')] [CODEX] $*" | tee -a "$CODEX_LOG"
+    local line
+    printf -v line '[%(%Y-%m-%d %H:%M:%S)T] [CODEX] %s' -1 "$*"
+    echo "$line"
+    echo "$line" >> "$CODEX_LOG"
 }
 
 # Check if Codex should be enabled
@@ -53,7 +56,7 @@ analyze_code() {
     fi
     
     # Read file content
-    local content=$(cat "$file_path" | head -1000)  # Limit to first 1000 lines
+    local content=$(head -n 1000 "$file_path")  # Limit to first 1000 lines
     
     # Create prompt based on analysis type
     local prompt
@@ -72,28 +75,27 @@ analyze_code() {
             ;;
     esac
     
-    # Call OpenAI API
-    local response=$(curl -s -X POST "https://api.openai.com/v1/chat/completions" \
+    # Build the request body with jq in one pass and stream it to curl. The
+    # prompt goes through stdin (-Rs) rather than --arg, which would hit the
+    # kernel's per-argument size limit on large files
+    local response=$(printf '%s' "$prompt" | jq -Rs \
+        --arg model "$CODEX_MODEL" \
+        '{
+            model: $model,
+            messages: [
+                {
+                    role: "system",
+                    content: "You are an expert code reviewer. Provide concise, actionable feedback."
+                },
+                {role: "user", content: .}
+            ],
+            temperature: 0.3,
+            max_tokens: 1000
+        }' | \
+        curl -s -X POST "https://api.openai.com/v1/chat/completions" \
         -H "Content-Type: application/json" \
         -H "Authorization: Bearer $CODEX_API_KEY" \
-        -d @- <<EOF
-{
-    "model": "$CODEX_MODEL",
-    "messages": [
-        {
-            "role": "system",
-            "content": "You are an expert code reviewer. Provide concise, actionable feedback."
-        },
-        {
-            "role": "user",
-            "content": $(echo "$prompt" | jq -Rs .)
-        }
-    ],
-    "temperature": 0.3,
-    "max_tokens": 1000
-}
-EOF
-    )
+        -d @-)
     
     # Extract and return the analysis
     echo "$response" | jq -r '.choices[0].message.content' 2>/dev/null || {
@@ -150,23 +152,27 @@ enhance_review() {
     # Create temporary file for enhanced review
     local enhanced_review="$HOME/.claudebox/logs/enhanced_review.md"
     
-    echo "# Enhanced Code Review (Codex)" > "$enhanced_review"
-    echo "" >> "$enhanced_review"
-    
-    # Analyze each changed file
-    while IFS= read -r file; do
-        if [ -f "$file" ]; then
-            echo "## File: $file" >> "$enhanced_review"
-            echo "" >> "$enhanced_review"
-            
-            # Run different types of analysis
-            for analysis_type in "review" "security" "performance"; do
-                echo "### ${analysis_type^} Analysis" >> "$enhanced_review"
-                analyze_code "$file" "$analysis_type" >> "$enhanced_review" 2>/dev/null || echo "Analysis failed" >> "$enhanced_review"
-                echo "" >> "$enhanced_review"
-            done
-        fi
-    done <<< "$changed_files"
+    # Write the whole report through one redirection instead of
+    # reopening the file for every line
+    {
+        echo "# Enhanced Code Review (Codex)"
+        echo ""
+        
+        # Analyze each changed file
+        while IFS= read -r file; do
+            if [ -f "$file" ]; then
+                echo "## File: $file"
+                echo ""
+                
+                # Run different types of analysis
+                for analysis_type in "review" "security" "performance"; do
+                    echo "### ${analysis_type^} Analysis"
+                    analyze_code "$file" "$analysis_type" 2>/dev/null || echo "Analysis failed"
+                    echo ""
+                done
+            fi
+        done <<< "$changed_files"
+    } > "$enhanced_review"
     
     log_codex "Enhanced review complete"
     echo "$enhanced_review"
@@ -20,14 +20,20 @@ REVIEWER_PROMPT="$SCRIPT_DIR/../prompts/reviewer.md"
 TESTER_PROMPT="$SCRIPT_DIR/../prompts/tester.md"
 
 # Logging functions
+# Timestamps use the printf builtin so logging does not fork date/tee per line
 log() {
-    echo "[$(date +'%Y-%m-%d %H:%M:%S')] $*" | tee -a "$LOG_DIR/agent_loop.log"
+    local line
+    printf -v line '[%(%Y-%m-%d %H:%M:%S)T] %s' -1 "$*"
+    echo "$line"
+    echo "$line" >> "$LOG_DIR/agent_loop.log"
 }
 
 log_agent() {
-    local agent=$1
+    local agent=$1 line
     shift
-    echo "[$(date +'%Y-%m-%d %H:%M:%S')] [$agent] $*" | tee -a "$LOG_DIR/${agent}.log"
+    printf -v line '[%(%Y-%m-%d %H:%M:%S)T] [%s] %s' -1 "$agent" "$*"
+    echo "$line"
+    echo "$line" >> "$LOG_DIR/${agent}.log"
 }
 
 # Agent execution functions
@@ -41,7 +47,7 @@ run_planner() {
 ## Current Iteration: $ITERATION
 
 ## Instructions
-$(cat "$PLANNER_PROMPT")
+$(<"$PLANNER_PROMPT")
 
 ## Current Project State
 - Working Directory: $(pwd)
@@ -50,13 +56,8 @@ $(cat "$PLANNER_PROMPT")
 Please analyze the project and select the next task to work on.
 EOF
 
-    # Execute planner via Claude
-    if command -v claude >/dev/null 2>&1; then
-        claude -c "$LOG_DIR/planner_context.md" "Select the next task following the planner agent guidelines" > "$LOG_DIR/planner_output.md"
-    else
-        log_agent "PLANNER" "Claude CLI not found. Please ensure Claude is properly installed."
-        return 1
-    fi
+    # Execute planner via Claude (availability is checked once in main)
+    claude -c "$LOG_DIR/planner_context.md" "Select the next task following the planner agent guidelines" > "$LOG_DIR/planner_output.md"
     
     log_agent "PLANNER" "Task selection complete"
 }
@@ -75,21 +76,16 @@ run_developer() {
 $task
 
 ## Instructions
-$(cat "$DEVELOPER_PROMPT")
+$(<"$DEVELOPER_PROMPT")
 
 ## Planner Output
-$(cat "$LOG_DIR/planner_output.md")
+$(<"$LOG_DIR/planner_output.md")
 
 Please implement the selected task following the developer agent guidelines.
 EOF
 
     # Execute developer via Claude
-    if command -v claude >/dev/null 2>&1; then
-        claude -c "$LOG_DIR/developer_context.md" "Implement the task following the developer agent guidelines" > "$LOG_DIR/developer_output.md"
-    else
-        log_agent "DEVELOPER" "Claude CLI not found"
-        return 1
-    fi
+    claude -c "$LOG_DIR/developer_context.md" "Implement the task following the developer agent guidelines" > "$LOG_DIR/developer_output.md"
     
     log_agent "DEVELOPER" "Implementation complete"
 }
@@ -102,10 +98,10 @@ run_reviewer() {
 # Reviewer Context
 
 ## Instructions
-$(cat "$REVIEWER_PROMPT")
+$(<"$REVIEWER_PROMPT")
 
 ## Developer Output
-$(cat "$LOG_DIR/developer_output.md")
+$(<"$LOG_DIR/developer_output.md")
 
 ## Changed Files
 $(git diff --name-only 2>/dev/null || echo "Unable to determine changed files")
@@ -114,12 +110,7 @@ Please review the implementation following the reviewer agent guidelines.
 EOF
 
     # Execute reviewer via Claude
-    if command -v claude >/dev/null 2>&1; then
-        claude -c "$LOG_DIR/reviewer_context.md" "Review the changes following the reviewer agent guidelines" > "$LOG_DIR/reviewer_output.md"
-    else
-        log_agent "REVIEWER" "Claude CLI not found"
-        return 1
-    fi
+    claude -c "$LOG_DIR/reviewer_context.md" "Review the changes following the reviewer agent guidelines" > "$LOG_DIR/reviewer_output.md"
     
     log_agent "REVIEWER" "Review complete"
 }
@@ -132,24 +123,19 @@ run_tester() {
 # Tester Context
 
 ## Instructions
-$(cat "$TESTER_PROMPT")
+$(<"$TESTER_PROMPT")
 
 ## Developer Output
-$(cat "$LOG_DIR/developer_output.md")
+$(<"$LOG_DIR/developer_output.md")
 
 ## Reviewer Feedback
-$(cat "$LOG_DIR/reviewer_output.md")
+$(<"$LOG_DIR/reviewer_output.md")
 
 Please test the implementation following the tester agent guidelines.
 EOF
 
     # Execute tester via Claude
-    if command -v claude >/dev/null 2>&1; then
-        claude -c "$LOG_DIR/tester_context.md" "Test the implementation following the tester agent guidelines" > "$LOG_DIR/tester_output.md"
-    else
-        log_agent "TESTER" "Claude CLI not found"
-        return 1
-    fi
+    claude -c "$LOG_DIR/tester_context.md" "Test the implementation following the tester agent guidelines" > "$LOG_DIR/tester_output.md"
     
     log_agent "TESTER" "Testing complete"
 }
@@ -179,10 +165,8 @@ Please provide a high-level architectural review and recommendations.
 EOF
 
     # Use opus model for megathink if available
-    if command -v claude >/dev/null 2>&1; then
-        claude --model claude-3-opus-20240229 -c "$LOG_DIR/megathink_context.md" "Perform architectural review" > "$LOG_DIR/megathink_output.md" 2>/dev/null || \
-        claude -c "$LOG_DIR/megathink_context.md" "Perform architectural review" > "$LOG_DIR/megathink_output.md"
-    fi
+    claude --model claude-3-opus-20240229 -c "$LOG_DIR/megathink_context.md" "Perform architectural review" > "$LOG_DIR/megathink_output.md" 2>/dev/null || \
+    claude -c "$LOG_DIR/megathink_context.md" "Perform architectural review" > "$LOG_DIR/megathink_output.md"
     
     log "Megathink complete"
 }
@@ -253,16 +237,16 @@ main() {
 # Iteration $ITERATION Summary
 
 ## Planner Output
-$(cat "$LOG_DIR/planner_output.md")
+$(<"$LOG_DIR/planner_output.md")
 
 ## Developer Output
-$(cat "$LOG_DIR/developer_output.md")
+$(<"$LOG_DIR/developer_output.md")
 
 ## Reviewer Output
-$(cat "$LOG_DIR/reviewer_output.md")
+$(<"$LOG_DIR/reviewer_output.md")
 
 ## Tester Output
-$(cat "$LOG_DIR/tester_output.md")
+$(<"$LOG_DIR/tester_output.md")
 EOF
         
         log "Iteration $ITERATION complete"
@@ -277,5 +261,7 @@ EOF
 # Handle interrupts gracefully
 trap 'log "Interrupted, saving state..."; exit 0' INT TERM
 
-# Run main loop
-main "$@"
\ No newline at end of file
+# Run main loop if executed directly
+if [[ "${BASH_SOURCE[0]}" = "${0}" ]]; then
+    main "$@"
+fi
\ No newline at end of file
@@ -28,16 +28,26 @@ BLUE='\033[0;34m'
 NC='\033[0m'
 
 # Logging functions
+# Timestamps use the printf builtin so logging does not fork date/tee per line
 log() {
-    echo -e "${BLUE}[$(date +'%Y-%m-%d %H:%M:%S')]${NC} $*" | tee -a "$LOG_DIR/interactive_loop.log"
+    local ts
+    printf -v ts '%(%Y-%m-%d %H:%M:%S)T' -1
+    echo -e "${BLUE}[$ts]${NC} $*"
+    echo -e "${BLUE}[$ts]${NC} $*" >> "$LOG_DIR/interactive_loop.log"
 }
 
 log_error() {
-    echo -e "${RED}[$(date +'%Y-%m-%d %H:%M:%S')] ERROR:${NC} $*" | tee -a "$LOG_DIR/interactive_loop.log" >&2
+    local ts
+    printf -v ts '%(%Y-%m-%d %H:%M:%S)T' -1
+    echo -e "${RED}[$ts] ERROR:${NC} $*" >&2
+    echo -e "${RED}[$ts] ERROR:${NC} $*" >> "$LOG_DIR/interactive_loop.log"
 }
 
 log_success() {
-    echo -e "${GREEN}[$(date +'%Y-%m-%d %H:%M:%S')] SUCCESS:${NC} $*" | tee -a "$LOG_DIR/interactive_loop.log"
+    local ts
+    printf -v ts '%(%Y-%m-%d %H:%M:%S)T' -1
+    echo -e "${GREEN}[$ts] SUCCESS:${NC} $*"
+    echo -e "${GREEN}[$ts] SUCCESS:${NC} $*" >> "$LOG_DIR/interactive_loop.log"
 }
 
 # Generate questions from plan using Opus
@@ -56,7 +66,7 @@ generate_questions() {
 # Question Generation for Development Iteration
 
 ## Plan Content
-$(cat "$plan_file")
+$(<"$plan_file")
 
 ## Task
 You are preparing for a development iteration. Based on the plan above, generate 3-5 specific questions that will help guide the development team. These questions should:
@@ -86,20 +96,15 @@ Categories can be: Requirements, Technical, Priority, Testing, Dependencies, etc
 EOF
 
     # Use Claude Opus to generate questions
-    if command -v claude >/dev/null 2>&1; then
-        claude --model "$OPUS_MODEL" -c "$LOG_DIR/question_prompt.md" \
-            "Generate specific development questions based on this plan" > "$QUESTIONS_FILE" 2>/dev/null || {
-            # Fallback to default model if Opus not available
-            claude -c "$LOG_DIR/question_prompt.md" \
-                "Generate specific development questions based on this plan" > "$QUESTIONS_FILE"
-        }
-        
-        log_success "Questions generated"
-        return 0
-    else
-        log_error "Claude CLI not found"
-        return 1
-    fi
+    claude --model "$OPUS_MODEL" -c "$LOG_DIR/question_prompt.md" \
+        "Generate specific development questions based on this plan" > "$QUESTIONS_FILE" 2>/dev/null || {
+        # Fallback to default model if Opus not available
+        claude -c "$LOG_DIR/question_prompt.md" \
+            "Generate specific development questions based on this plan" > "$QUESTIONS_FILE"
+    }
+    
+    log_success "Questions generated"
+    return 0
 }
 
 # Open vim for user to answer questions
@@ -115,7 +120,7 @@ Save and exit when done (:wq in vim).
 
 ---
 
-$(cat "$QUESTIONS_FILE")
+$(<"$QUESTIONS_FILE")
 
 ---
 
@@ -152,10 +157,10 @@ run_iteration_with_context() {
 # Iteration $iteration_num Context
 
 ## Original Plan
-$(cat "$plan_file")
+$(<"$plan_file")
 
 ## Questions and Answers
-$(cat "$ANSWERS_FILE")
+$(<"$ANSWERS_FILE")
 
 ## Iteration Goal
 Execute one development cycle based on the plan and answers above. Focus on:
@@ -196,18 +201,16 @@ run_planner_with_context() {
 # Planner Context
 
 ## Iteration Context
-$(cat "$context_file")
+$(<"$context_file")
 
 ## Instructions
-$(cat "$PLANNER_PROMPT")
+$(<"$PLANNER_PROMPT")
 
 Based on the plan, questions, and answers above, select the most appropriate tasks for this iteration.
 EOF
 
-    if command -v claude >/dev/null 2>&1; then
-        claude -c "$LOG_DIR/planner_context.md" \
-            "Select tasks for this iteration based on the context" > "$LOG_DIR/planner_output.md"
-    fi
+    claude -c "$LOG_DIR/planner_context.md" \
+        "Select tasks for this iteration based on the context" > "$LOG_DIR/planner_output.md"
     
     log_agent "PLANNER" "Task selection complete"
 }
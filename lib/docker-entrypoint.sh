@@ -26,7 +26,7 @@ installed_file="/home/DOCKERUSER/.claudebox-project/.installed"
 if [ -f "$install_list" ]; then
     if [ ! -f "$installed_file" ] || [ "$install_list" -nt "$installed_file" ]; then
         DEBIAN_FRONTEND=noninteractive apt-get update
-        cat "$install_list" | grep -v '^#' | grep -v '^$' | xargs -r apt-get install -y
+        grep -Ev '^(#|$)' "$install_list" | xargs -r apt-get install -y
         apt-get clean && rm -rf /var/lib/apt/lists/*
         cp "$install_list" "$installed_file"
     fi
@@ -64,8 +64,8 @@ else
     # Build command with properly quoted arguments
     cmd="cd /workspace && /home/DOCKERUSER/claude-wrapper"
     for arg in "$@"; do
-        # Escape single quotes in the argument
-        escaped_arg=$(echo "$arg" | sed "s/'/'\\\\''/g")
+        # Escape single quotes in the argument (parameter expansion, no subshell)
+        escaped_arg=${arg//\'/\'\\\'\'}
         cmd="$cmd '$escaped_arg'"
     done
     exec su DOCKERUSER -c "$cmd"